@@ -8,22 +8,144 @@ import time
 import json
 import os
 import sys
+import argparse
 from datetime import datetime
 import pygetwindow as gw
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+SPEED_MIN = 0.1
+SPEED_MAX = 3.0
+SPEED_STEP = 0.1
+# Longest single sleep while waiting for an event, so speed changes and stop
+# requests are picked up even across long idle gaps in a recording
+MAX_SLEEP_SLICE = 0.02
+
+
+def bisect_timestamp(events, timestamp, lo, hi):
+    """Index of the first event in events[lo:hi] at or after timestamp"""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if events[mid]['timestamp'] < timestamp:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class PlaybackClock:
+    """Piecewise time-warp between wall time and macro time.
+
+    Each speed change re-anchors the timeline at the current instant, so the
+    macro position stays continuous and only the rate changes from then on.
+    """
+
+    def __init__(self, speed=1.0):
+        self.lock = threading.Lock()
+        self.speed = speed
+        self.anchor_wall = time.perf_counter()
+        self.anchor_macro = 0.0
+
+    def _macro_time(self, wall):
+        return self.anchor_macro + (wall - self.anchor_wall) * self.speed
+
+    def start(self):
+        """Anchor the start of the macro to now"""
+        with self.lock:
+            self.anchor_wall = time.perf_counter()
+            self.anchor_macro = 0.0
+
+    def set_speed(self, speed):
+        """Change speed without moving the current macro position"""
+        with self.lock:
+            wall = time.perf_counter()
+            self.anchor_macro = self._macro_time(wall)
+            self.anchor_wall = wall
+            self.speed = speed
+
+    def wait_until(self, macro_time, keep_waiting):
+        """Sleep until the timeline reaches macro_time.
+
+        Returns False if keep_waiting() turned false before that point.
+        """
+        while True:
+            with self.lock:
+                remaining = (macro_time - self._macro_time(time.perf_counter())) / self.speed
+            if remaining <= 0:
+                return True
+            if not keep_waiting():
+                return False
+            time.sleep(min(remaining, MAX_SLEEP_SLICE))
+
+
+class MacroEdit:
+    """Macro assembled from [start, end) ranges of existing event lists.
+
+    Each segment is (events, lo, hi, shift): a reference to a source list,
+    an index range into it and the offset added to its timestamps. Trimming
+    and splicing only touch segments; events are copied in materialize().
+    """
+
+    def __init__(self, segments=(), duration=0.0):
+        self.segments = list(segments)
+        self.duration = duration
+
+    @classmethod
+    def from_events(cls, events, duration=0.0):
+        """Wrap events; duration may extend past the last event, e.g. after a trim"""
+        if not events:
+            return cls((), duration)
+        return cls([(events, 0, len(events), 0.0)], max(duration, events[-1]['timestamp']))
+
+    def __len__(self):
+        return sum(hi - lo for _, lo, hi, _ in self.segments)
+
+    def slice(self, start=0.0, end=None):
+        """Return the [start, end) range, re-based to begin at 0"""
+        start = max(0.0, start)
+        # An end at or past the last event keeps it, rather than cutting it off
+        keep_tail = end is None or end >= self.duration
+        end = self.duration if keep_tail else end
+        
+        segments = []
+        for events, lo, hi, shift in self.segments:
+            new_lo = bisect_timestamp(events, start - shift, lo, hi)
+            new_hi = hi if keep_tail else bisect_timestamp(events, end - shift, new_lo, hi)
+            if new_lo < new_hi:
+                segments.append((events, new_lo, new_hi, shift - start))
+        return MacroEdit(segments, max(0.0, end - start))
+
+    def concat(self, other):
+        """Return this macro followed by other, starting at our duration"""
+        offset = self.duration
+        segments = self.segments + [
+            (events, lo, hi, shift + offset) for events, lo, hi, shift in other.segments
+        ]
+        return MacroEdit(segments, offset + other.duration)
+
+    def iter_timed(self):
+        """Yield (timestamp, event) pairs without copying the events"""
+        for events, lo, hi, shift in self.segments:
+            for i in range(lo, hi):
+                event = events[i]
+                yield event['timestamp'] + shift, event
+
+    def materialize(self):
+        return [dict(event, timestamp=timestamp) for timestamp, event in self.iter_timed()]
+
+
 class MacroRecorder:
-    def __init__(self):
+    def __init__(self, speed=None):
         # Setup application directories
         self.setup_directories()
         
         self.window = ctk.CTk()
         self.window.title("Macro+ v1.0")
-        self.window.geometry("450x650")
+        self.window.geometry("450x770")
         self.window.resizable(False, False)
         self.window.configure(fg_color="#1a1a1a")
         
@@ -36,12 +158,14 @@ class MacroRecorder:
         self.is_recording = False
         self.is_playing = False
         self.recorded_events = []
+        self.current_macro = MacroEdit()
         self.start_time = None
         self.playback_speed = 1.0
         self.repeat_count = 1
         self.event_buffer = deque(maxlen=10000)
         self.buffer_lock = threading.Lock()
         self.last_mouse_pos = None
+        self.playlist = []
         
         # Controllers
         self.keyboard_controller = KeyboardController()
@@ -52,6 +176,13 @@ class MacroRecorder:
         
         # Load settings
         self.load_settings()
+        self.load_playlist()
+        # A --speed override applies to this session only, not to config.json
+        self.saved_speed = self.playback_speed
+        self.persist_speed = speed is None
+        if speed is not None:
+            self.playback_speed = self.clamp_speed(speed)
+        self.playback_clock = PlaybackClock(self.playback_speed)
         
         self.setup_hotkeys()
         self.setup_ui()
@@ -75,6 +206,7 @@ class MacroRecorder:
             directory.mkdir(parents=True, exist_ok=True)
         
         self.settings_file = self.settings_dir / "config.json"
+        self.playlist_file = self.settings_dir / "playlist.json"
         
     def load_settings(self):
         """Load user settings"""
@@ -91,7 +223,7 @@ class MacroRecorder:
         """Save user settings"""
         try:
             settings = {
-                'speed': self.playback_speed,
+                'speed': self.playback_speed if self.persist_speed else self.saved_speed,
                 'repeat': self.repeat_count
             }
             with open(self.settings_file, 'w') as f:
@@ -102,8 +234,10 @@ class MacroRecorder:
     def setup_hotkeys(self):
         hotkeys = {
             '<f9>': lambda: self.window.after(0, self.toggle_recording),
-            '<f10>': lambda: self.window.after(0, self.play_macro) if len(self.recorded_events) > 0 else None,
+            '<f10>': lambda: self.window.after(0, self.play_macro) if len(self.current_macro) > 0 else None,
             '<f11>': lambda: self.window.after(0, self.stop_recording if self.is_recording else self.stop_playback),
+            '<f7>': lambda: self.window.after(0, self.step_speed, -SPEED_STEP),
+            '<f8>': lambda: self.window.after(0, self.step_speed, SPEED_STEP),
         }
         try:
             self.hotkey_listener = GlobalHotKeys(hotkeys)
@@ -204,8 +338,8 @@ class MacroRecorder:
         self.speed_var = ctk.DoubleVar(value=self.playback_speed)
         self.speed_slider = ctk.CTkSlider(
             speed_frame,
-            from_=0.1,
-            to=3.0,
+            from_=SPEED_MIN,
+            to=SPEED_MAX,
             variable=self.speed_var,
             command=self.update_speed_label,
             height=20,
@@ -367,6 +501,118 @@ class MacroRecorder:
         )
         delete_btn.pack(side="left", fill="x", expand=True, padx=(3, 0))
         
+        # Playlist buttons
+        actions_row2 = ctk.CTkFrame(library_frame, fg_color="transparent")
+        actions_row2.pack(fill="x", padx=15, pady=(0, 10))
+        
+        queue_btn = ctk.CTkButton(
+            actions_row2,
+            text="+ Playlist",
+            command=self.add_to_playlist,
+            corner_radius=6,
+            height=35,
+            fg_color="#6f42c1",
+            hover_color="#59339d",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        queue_btn.pack(side="left", fill="x", expand=True, padx=(0, 3))
+        
+        clear_btn = ctk.CTkButton(
+            actions_row2,
+            text="Clear",
+            command=self.clear_playlist,
+            corner_radius=6,
+            height=35,
+            fg_color="#6c757d",
+            hover_color="#5a6268",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        clear_btn.pack(side="left", fill="x", expand=True, padx=(3, 3))
+        
+        self.playlist_btn = ctk.CTkButton(
+            actions_row2,
+            text="▶ Playlist",
+            command=self.play_playlist,
+            corner_radius=6,
+            height=35,
+            fg_color="#28a745",
+            hover_color="#218838",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        self.playlist_btn.pack(side="left", fill="x", expand=True, padx=(3, 0))
+        
+        # Edit buttons - trim the current macro or append a saved one to it
+        actions_row3 = ctk.CTkFrame(library_frame, fg_color="transparent")
+        actions_row3.pack(fill="x", padx=15, pady=(0, 10))
+        
+        self.trim_start_entry = ctk.CTkEntry(
+            actions_row3,
+            placeholder_text="Start s",
+            corner_radius=6,
+            height=35,
+            width=70,
+            justify="center",
+            font=ctk.CTkFont(size=12),
+            fg_color="#3a3a3a",
+            border_width=1,
+            border_color="#4a4a4a",
+            placeholder_text_color="#666666",
+            text_color="#ffffff"
+        )
+        self.trim_start_entry.pack(side="left", padx=(0, 3))
+        
+        self.trim_end_entry = ctk.CTkEntry(
+            actions_row3,
+            placeholder_text="End s",
+            corner_radius=6,
+            height=35,
+            width=70,
+            justify="center",
+            font=ctk.CTkFont(size=12),
+            fg_color="#3a3a3a",
+            border_width=1,
+            border_color="#4a4a4a",
+            placeholder_text_color="#666666",
+            text_color="#ffffff"
+        )
+        self.trim_end_entry.pack(side="left", padx=(3, 3))
+        
+        trim_btn = ctk.CTkButton(
+            actions_row3,
+            text="Trim",
+            command=self.trim_macro,
+            corner_radius=6,
+            height=35,
+            fg_color="#fd7e14",
+            hover_color="#dc6a0c",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        trim_btn.pack(side="left", fill="x", expand=True, padx=(3, 3))
+        
+        append_btn = ctk.CTkButton(
+            actions_row3,
+            text="Append",
+            command=self.append_macro,
+            corner_radius=6,
+            height=35,
+            fg_color="#17a2b8",
+            hover_color="#138496",
+            font=ctk.CTkFont(size=12, weight="bold")
+        )
+        append_btn.pack(side="left", fill="x", expand=True, padx=(3, 0))
+        
+        # Playlist summary, redrawn on its own so queue edits don't reread every macro file
+        self.playlist_label = ctk.CTkLabel(
+            library_frame,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color="#999999",
+            wraplength=400,
+            justify="left"
+        )
+        self.playlist_label.pack(anchor="w", padx=15, pady=(0, 6))
+        self.update_playlist_label()
+        
         # Macro list
         list_frame = ctk.CTkFrame(library_frame, fg_color="#1a1a1a", corner_radius=6)
         list_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
@@ -385,7 +631,7 @@ class MacroRecorder:
         # Hotkeys info at bottom
         hotkeys_label = ctk.CTkLabel(
             main,
-            text="F9: Record/Stop | F10: Play | F11: Stop Playback",
+            text="F9: Record/Stop | F10: Play | F11: Stop | F7/F8: Speed -/+",
             font=ctk.CTkFont(size=10),
             text_color="#666666"
         )
@@ -403,7 +649,24 @@ class MacroRecorder:
     
     def update_speed_label(self, value):
         self.playback_speed = float(value)
-        self.speed_label.configure(text=f"{self.playback_speed:.1f}x")
+        self.playback_clock.set_speed(self.playback_speed)
+        self.show_speed(self.playback_speed)
+    
+    def show_speed(self, speed):
+        self.speed_label.configure(text=f"{speed:.1f}x")
+    
+    def clamp_speed(self, speed):
+        return min(SPEED_MAX, max(SPEED_MIN, float(speed)))
+    
+    def set_speed(self, speed):
+        """Set playback speed; safe to call while a macro is playing"""
+        speed = self.clamp_speed(speed)
+        self.speed_var.set(speed)
+        self.update_speed_label(speed)
+    
+    def step_speed(self, delta):
+        # Step from the speed in effect, which a playlist item may have set
+        self.set_speed(round(self.playback_clock.speed + delta, 1))
     
     def toggle_recording(self):
         if not self.is_recording:
@@ -414,6 +677,7 @@ class MacroRecorder:
     def start_recording(self):
         self.is_recording = True
         self.recorded_events = []
+        self.current_macro = MacroEdit()
         self.event_buffer.clear()
         self.start_time = time.time()
         self.last_mouse_pos = None
@@ -448,14 +712,14 @@ class MacroRecorder:
         if self.mouse_listener:
             self.mouse_listener.stop()
         
+        self.current_macro = MacroEdit.from_events(self.recorded_events)
+        
         self.record_btn.configure(text="● Record", fg_color="#dc3545")
-        if self.recorded_events:
+        if len(self.current_macro):
             self.play_btn.configure(state="normal")
         
-        duration = self.recorded_events[-1]['timestamp'] if self.recorded_events else 0
-        self.update_status(f"Recorded {len(self.recorded_events)} events", "#28a745")
-        self.events_label.configure(text=f"Events: {len(self.recorded_events)}")
-        self.duration_label.configure(text=f"Duration: {duration:.1f}s")
+        self.update_status(f"Recorded {len(self.current_macro)} events", "#28a745")
+        self.update_macro_stats()
     
     def on_key_press(self, key):
         if self.is_recording:
@@ -502,14 +766,11 @@ class MacroRecorder:
                 self.last_mouse_pos = (x, y)
     
     def play_macro(self):
-        if not self.recorded_events:
+        if not len(self.current_macro):
             self.update_status("No macro loaded", "#ffc107")
             return
         
-        self.is_playing = True
-        self.play_btn.configure(state="disabled")
-        self.stop_btn.configure(state="normal")
-        self.record_btn.configure(state="disabled")
+        self.begin_playback()
         
         repeat = self.repeat_var.get()
         repeat_text = "∞" if repeat == 0 else str(repeat)
@@ -517,51 +778,104 @@ class MacroRecorder:
         
         threading.Thread(target=self.playback_thread, args=(repeat,), daemon=True).start()
     
+    def begin_playback(self):
+        self.is_playing = True
+        self.play_btn.configure(state="disabled")
+        self.playlist_btn.configure(state="disabled")
+        self.stop_btn.configure(state="normal")
+        self.record_btn.configure(state="disabled")
+    
     def playback_thread(self, repeat):
+        try:
+            compiled = self.compile_events(self.current_macro.iter_timed())
+            self.play_compiled(compiled, repeat)
+        finally:
+            self.is_playing = False
+            self.window.after(0, self.playback_finished)
+    
+    def play_compiled(self, compiled, repeat):
+        """Play compiled events repeat times (0 = until stopped)"""
         iterations = 0
         while self.is_playing:
             if repeat != 0 and iterations >= repeat:
                 break
             
-            start_time = time.time()
-            last_mouse_event = None
+            self.playback_clock.start()
+            # Keys and buttons pressed this pass; a trimmed or stopped macro
+            # may never reach their release, so they are let go afterwards
+            held = set()
             
-            for i, event in enumerate(self.recorded_events):
-                if not self.is_playing:
+            for timestamp, kind, args in compiled:
+                if not self.playback_clock.wait_until(timestamp, lambda: self.is_playing):
                     break
                 
-                target_time = start_time + (event['timestamp'] / self.playback_speed)
-                sleep_time = target_time - time.time()
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                
                 try:
-                    if event['type'] == 'key_press':
-                        self.simulate_key(event['key'], True)
-                    elif event['type'] == 'key_release':
-                        self.simulate_key(event['key'], False)
-                    elif event['type'] == 'mouse_click':
-                        self.simulate_click(event)
-                    elif event['type'] == 'mouse_move':
+                    if kind == 'key':
+                        key, press = args
+                        if press:
+                            self.keyboard_controller.press(key)
+                            held.add(('key', key))
+                        else:
+                            self.keyboard_controller.release(key)
+                            held.discard(('key', key))
+                    elif kind == 'click':
+                        x, y, button, pressed = args
+                        self.mouse_controller.position = (x, y)
+                        if pressed:
+                            self.mouse_controller.press(button)
+                            held.add(('click', button))
+                        else:
+                            self.mouse_controller.release(button)
+                            held.discard(('click', button))
+                    elif kind == 'move':
+                        x, y, previous = args
                         # Smooth mouse movement with interpolation
-                        if last_mouse_event and last_mouse_event['type'] == 'mouse_move':
-                            self.smooth_mouse_move(
-                                last_mouse_event['x'], last_mouse_event['y'],
-                                event['x'], event['y'],
-                                steps=5
-                            )
+                        if previous:
+                            self.smooth_mouse_move(previous[0], previous[1], x, y, steps=5)
                         else:
-                            self.mouse_controller.position = (event['x'], event['y'])
-                        last_mouse_event = event
+                            self.mouse_controller.position = (x, y)
                 except:
                     pass
             
+            self.release_held(held)
             iterations += 1
             if repeat == 0 or iterations < repeat:
                 time.sleep(0.1)
-        
-        self.is_playing = False
-        self.window.after(0, self.playback_finished)
+    
+    def release_held(self, held):
+        for kind, value in held:
+            try:
+                if kind == 'key':
+                    self.keyboard_controller.release(value)
+                else:
+                    self.mouse_controller.release(value)
+            except:
+                pass
+    
+    def compile_events(self, timed_events):
+        """Resolve (timestamp, event) pairs into ready-to-fire (timestamp, kind, args) tuples.
+        
+        Safe to run off the Tk thread, so the next playlist item can be
+        prepared while the current one is still playing.
+        """
+        compiled = []
+        last_move = None
+        for timestamp, event in timed_events:
+            # Malformed events are skipped, as the playback loop always did
+            try:
+                if event['type'] in ('key_press', 'key_release'):
+                    key = self.resolve_key(event['key'])
+                    if key is not None:
+                        compiled.append((timestamp, 'key', (key, event['type'] == 'key_press')))
+                elif event['type'] == 'mouse_click':
+                    button = Button.left if 'left' in event['button'].lower() else Button.right
+                    compiled.append((timestamp, 'click', (event['x'], event['y'], button, event['pressed'])))
+                elif event['type'] == 'mouse_move':
+                    compiled.append((timestamp, 'move', (event['x'], event['y'], last_move)))
+                    last_move = (event['x'], event['y'])
+            except (KeyError, TypeError, AttributeError):
+                pass
+        return compiled
     
     def smooth_mouse_move(self, x1, y1, x2, y2, steps=5):
         """Interpolate mouse movement for smoother playback"""
@@ -574,31 +888,131 @@ class MacroRecorder:
             self.mouse_controller.position = (x, y)
             time.sleep(0.001)  # Tiny delay for smooth movement
     
-    def simulate_key(self, key_str, press):
+    def resolve_key(self, key_str):
+        if key_str.startswith("Key."):
+            return getattr(Key, key_str.replace("Key.", ""), None)
+        return key_str.strip("'")
+    
+    def load_playlist(self):
+        """Load saved playlist"""
         try:
-            if key_str.startswith("Key."):
-                key = getattr(Key, key_str.replace("Key.", ""), None)
-                if key:
-                    self.keyboard_controller.press(key) if press else self.keyboard_controller.release(key)
-            else:
-                key_char = key_str.strip("'")
-                self.keyboard_controller.press(key_char) if press else self.keyboard_controller.release(key_char)
+            if self.playlist_file.exists():
+                with open(self.playlist_file, 'r') as f:
+                    items = json.load(f).get('items', [])
+                # Drop anything a hand edit may have broken
+                self.playlist = [item for item in items if self.is_valid_playlist_item(item)]
+        except:
+            self.playlist = []
+    
+    def is_valid_playlist_item(self, item):
+        if not isinstance(item, dict) or not isinstance(item.get('name'), str):
+            return False
+        # bool is an int subclass, so rule it out explicitly
+        repeat = item.get('repeat', 1)
+        if isinstance(repeat, bool) or not isinstance(repeat, int):
+            return False
+        speed = item.get('speed', 1.0)
+        return not isinstance(speed, bool) and isinstance(speed, (int, float))
+    
+    def save_playlist(self):
+        """Save playlist"""
+        try:
+            with open(self.playlist_file, 'w') as f:
+                json.dump({'items': self.playlist}, f, indent=2)
         except:
             pass
     
-    def simulate_click(self, event):
-        self.mouse_controller.position = (event['x'], event['y'])
-        button = Button.left if 'left' in event['button'].lower() else Button.right
-        if event['pressed']:
-            self.mouse_controller.press(button)
-        else:
-            self.mouse_controller.release(button)
+    def add_to_playlist(self):
+        name = self.macro_entry.get().strip()
+        if not name:
+            self.update_status("Enter macro name to queue", "#ffc107")
+            return
+        
+        if not (self.macros_dir / f"{name}.json").exists():
+            self.update_status(f"Macro '{name}' not found", "#dc3545")
+            return
+        
+        repeat = self.repeat_var.get()
+        if repeat < 1:
+            # An infinite item would never hand over to the rest of the queue
+            self.update_status("Playlist items need a repeat count of 1 or more", "#ffc107")
+            return
+        
+        self.playlist.append({
+            'name': name,
+            'speed': self.playback_speed,
+            'repeat': repeat
+        })
+        self.save_playlist()
+        self.update_status(f"Queued '{name}' ({len(self.playlist)} in playlist)", "#28a745")
+        self.update_playlist_label()
+    
+    def clear_playlist(self):
+        self.playlist = []
+        self.save_playlist()
+        self.update_status("Playlist cleared", "#dc3545")
+        self.update_playlist_label()
+    
+    def play_playlist(self):
+        if not self.playlist:
+            self.update_status("Playlist is empty", "#ffc107")
+            return
+        
+        self.begin_playback()
+        self.update_status(f"Playing playlist ({len(self.playlist)} items)", "#28a745")
+        
+        items = [dict(item) for item in self.playlist]
+        threading.Thread(target=self.playlist_thread, args=(items,), daemon=True).start()
+    
+    def playlist_thread(self, items):
+        # A single worker reads and compiles the next macro while the current
+        # one plays, so there is no loading gap between items
+        loader = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = loader.submit(self.prepare_macro, items[0]['name'])
+            for index, item in enumerate(items):
+                if not self.is_playing:
+                    break
+                
+                try:
+                    compiled = pending.result()
+                except:
+                    compiled = None
+                if index + 1 < len(items):
+                    pending = loader.submit(self.prepare_macro, items[index + 1]['name'])
+                
+                if compiled is None:
+                    self.window.after(0, self.update_status, f"Skipped '{item['name']}'", "#dc3545")
+                    continue
+                
+                # Item speed only drives the clock; the user's own speed setting is left alone
+                speed = self.clamp_speed(item.get('speed', self.playback_speed))
+                self.playback_clock.set_speed(speed)
+                self.window.after(0, self.show_speed, speed)
+                self.window.after(0, self.update_status,
+                    f"Playlist {index + 1}/{len(items)}: {item['name']}", "#28a745")
+                
+                self.play_compiled(compiled, max(1, item.get('repeat', 1)))
+        finally:
+            # Don't hold up Stop waiting on a preload nobody will play
+            loader.shutdown(wait=False, cancel_futures=True)
+            self.is_playing = False
+            self.window.after(0, self.playback_finished)
+    
+    def prepare_macro(self, name):
+        macro_data = self.read_macro_file(name)
+        macro = MacroEdit.from_events(macro_data['events'], macro_data.get('duration', 0))
+        return self.compile_events(macro.iter_timed())
     
     def stop_playback(self):
         self.is_playing = False
     
     def playback_finished(self):
-        self.play_btn.configure(state="normal")
+        self.playback_clock.set_speed(self.playback_speed)
+        self.show_speed(self.playback_speed)
+        if len(self.current_macro):
+            self.play_btn.configure(state="normal")
+        self.playlist_btn.configure(state="normal")
         self.stop_btn.configure(state="disabled")
         self.record_btn.configure(state="normal")
         self.update_status("Playback complete", "#28a745")
@@ -609,16 +1023,18 @@ class MacroRecorder:
             self.update_status("Enter a macro name", "#ffc107")
             return
         
-        if not self.recorded_events:
+        if not len(self.current_macro):
             self.update_status("No macro to save", "#ffc107")
             return
         
+        # Export is the only place edited macros get copied into a flat list
+        events = self.current_macro.materialize()
         macro_data = {
             'name': name,
-            'events': self.recorded_events,
+            'events': events,
             'created': datetime.now().isoformat(),
-            'duration': self.recorded_events[-1]['timestamp'] if self.recorded_events else 0,
-            'event_count': len(self.recorded_events),
+            'duration': self.current_macro.duration,
+            'event_count': len(events),
             'speed': self.playback_speed,
             'repeat': self.repeat_var.get()
         }
@@ -637,26 +1053,75 @@ class MacroRecorder:
             self.update_status("Enter macro name to load", "#ffc107")
             return
         
-        macro_file = self.macros_dir / f"{name}.json"
-        if not macro_file.exists():
+        if not (self.macros_dir / f"{name}.json").exists():
             self.update_status(f"Macro '{name}' not found", "#dc3545")
             return
         
-        with open(macro_file, 'r') as f:
-            macro_data = json.load(f)
+        macro_data = self.read_macro_file(name)
         
-        self.recorded_events = macro_data['events']
+        self.current_macro = MacroEdit.from_events(macro_data['events'], macro_data.get('duration', 0))
         if 'speed' in macro_data:
-            self.speed_var.set(macro_data['speed'])
+            self.set_speed(macro_data['speed'])
         if 'repeat' in macro_data:
             self.repeat_var.set(macro_data['repeat'])
         
         self.play_btn.configure(state="normal")
-        duration = macro_data.get('duration', 0)
-        self.events_label.configure(text=f"Events: {len(self.recorded_events)}")
-        self.duration_label.configure(text=f"Duration: {duration:.1f}s")
+        self.update_macro_stats()
         self.update_status(f"Loaded '{name}'", "#28a745")
     
+    def trim_macro(self):
+        if not len(self.current_macro):
+            self.update_status("No macro to trim", "#ffc107")
+            return
+        
+        try:
+            start = float(self.trim_start_entry.get().strip() or 0)
+            end_text = self.trim_end_entry.get().strip()
+            end = float(end_text) if end_text else None
+        except ValueError:
+            self.update_status("Trim range must be in seconds", "#ffc107")
+            return
+        
+        if end is not None and end <= start:
+            self.update_status("Trim end must be after start", "#ffc107")
+            return
+        
+        self.current_macro = self.current_macro.slice(start, end)
+        self.update_play_button()
+        self.update_macro_stats()
+        self.update_status("Trimmed macro", "#28a745")
+    
+    def append_macro(self):
+        name = self.macro_entry.get().strip()
+        if not name:
+            self.update_status("Enter macro name to append", "#ffc107")
+            return
+        
+        if not (self.macros_dir / f"{name}.json").exists():
+            self.update_status(f"Macro '{name}' not found", "#dc3545")
+            return
+        
+        macro_data = self.read_macro_file(name)
+        other = MacroEdit.from_events(macro_data['events'], macro_data.get('duration', 0))
+        self.current_macro = self.current_macro.concat(other)
+        
+        self.update_play_button()
+        self.update_macro_stats()
+        self.update_status(f"Appended '{name}'", "#28a745")
+    
+    def update_play_button(self):
+        # playback_finished restores Play; don't offer a second playback meanwhile
+        if not self.is_playing:
+            self.play_btn.configure(state="normal" if len(self.current_macro) else "disabled")
+    
+    def update_macro_stats(self):
+        self.events_label.configure(text=f"Events: {len(self.current_macro)}")
+        self.duration_label.configure(text=f"Duration: {self.current_macro.duration:.1f}s")
+    
+    def read_macro_file(self, name):
+        with open(self.macros_dir / f"{name}.json", 'r') as f:
+            return json.load(f)
+    
     def delete_macro(self):
         name = self.macro_entry.get().strip()
         if not name:
@@ -698,6 +1163,13 @@ class MacroRecorder:
             except:
                 pass
     
+    def update_playlist_label(self):
+        if self.playlist:
+            text = "Playlist: " + " → ".join(item['name'] for item in self.playlist)
+        else:
+            text = "Playlist: empty"
+        self.playlist_label.configure(text=text)
+    
     def update_status(self, message, color):
         self.status_label.configure(text=message, text_color=color)
     
@@ -705,5 +1177,10 @@ class MacroRecorder:
         self.window.mainloop()
 
 if __name__ == "__main__":
-    app = MacroRecorder()
+    parser = argparse.ArgumentParser(description="Macro+ macro recorder")
+    parser.add_argument("--speed", type=float, default=None,
+                        help=f"initial playback speed ({SPEED_MIN}-{SPEED_MAX})")
+    args = parser.parse_args()
+    
+    app = MacroRecorder(speed=args.speed)
     app.run()
\ No newline at end of file